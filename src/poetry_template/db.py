@@ -1,17 +1,63 @@
 import logging
 import os
+import re
 import sqlite3
+import threading
+import weakref
 from abc import ABC, abstractmethod
+from collections.abc import Generator, Iterator, Sequence
+from contextlib import AbstractContextManager, contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, TypeVar, cast
+from typing import Any, TypeVar
 
-import psycopg2
-import psycopg2.pool
+import psycopg
+from psycopg.conninfo import make_conninfo
+from psycopg_pool import ConnectionPool
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound="DatabaseHandler")
 
+# アプリケーションのルートディレクトリ（プロセス中は不変のため起動時に一度だけ解決する）
+_APP_DIR = str(Path(__file__).resolve().parent.parent.parent)
+
+# SQLite接続時に適用するPRAGMA
+# WALモードで読み込みと書き込みが互いにブロックしないようにし、ロック競合時は即エラーにせず待機する
+SQLITE_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-8000;
+PRAGMA mmap_size=268435456;
+PRAGMA busy_timeout=5000;
+"""
+
+# PostgreSQLコネクションプールのサイズ（同時に接続するクライアント数に合わせて環境変数で調整する）
+POSTGRES_MIN_CONN = int(os.getenv("POSTGRES_MIN_CONN", "1"))
+POSTGRES_MAX_CONN = int(os.getenv("POSTGRES_MAX_CONN", "20"))
+
+# 初期化SQLスクリプトの内容（パスごとに一度だけ読み込む）
+_INIT_SQL_CACHE: dict[str, str] = {}
+
+# SQLite形式への変換用（文字列リテラル内の %s は置換しない）
+_SQLITE_PLACEHOLDER_RE = re.compile(r"%s(?=(?:[^']*'[^']*')*[^']*$)")
+
+
+@lru_cache(maxsize=512)
+def _to_sqlite_paramstyle(query: str) -> str:
+    """
+    PostgreSQL形式のプレースホルダ（%s）をSQLite形式（?）に変換する
+    文字列リテラル内の %s はそのまま残し、同じクエリ文字列は変換結果をキャッシュして再利用する
+
+    Args:
+        query: 変換するSQLクエリ
+
+    Returns:
+        str: SQLite形式に変換されたSQLクエリ
+    """
+    return _SQLITE_PLACEHOLDER_RE.sub("?", query)
+
 
 class BaseDatabaseHandler(ABC):
     """
@@ -46,6 +92,17 @@ class BaseDatabaseHandler(ABC):
         """
         raise NotImplementedError("子クラスで実装する必要があります")
 
+    @abstractmethod
+    def execute_many(self, query: str, seq_of_params: Sequence[tuple[Any, ...]]) -> None:
+        """
+        同じクエリを複数のパラメータでまとめて実行（一括挿入など）
+
+        Args:
+            query: 実行するSQLクエリ
+            seq_of_params: クエリパラメータのシーケンス
+        """
+        raise NotImplementedError("子クラスで実装する必要があります")
+
     @abstractmethod
     def fetch_query(self, query: str, params: tuple[Any, ...] | None = None) -> list[tuple[Any, ...]]:
         """
@@ -60,14 +117,58 @@ class BaseDatabaseHandler(ABC):
         """
         raise NotImplementedError("子クラスで実装する必要があります")
 
+    @abstractmethod
+    def iter_query(
+        self, query: str, params: tuple[Any, ...] | None = None, chunk_size: int = 1000
+    ) -> Generator[tuple[Any, ...], None, None]:
+        """
+        データを取得するクエリを実行し、結果を1行ずつ返す
+        結果全体をメモリに載せずに、chunk_size行ずつ読み込む
+
+        Args:
+            query: 実行するSQLクエリ
+            params: クエリパラメータ（プリペアドステートメント用）
+            chunk_size: 一度に読み込む行数
+
+        Yields:
+            Tuple[Any, ...]: クエリ結果の行
+        """
+        raise NotImplementedError("子クラスで実装する必要があります")
+
+    @abstractmethod
+    def transaction(self) -> AbstractContextManager[None]:
+        """
+        トランザクションを開始するコンテキストマネージャを返す
+        ブロック内で実行したクエリは終了時にまとめてコミットされ、例外が発生した場合はロールバックする
+
+        Returns:
+            AbstractContextManager[None]: トランザクションのコンテキストマネージャ
+        """
+        raise NotImplementedError("子クラスで実装する必要があります")
+
     @abstractmethod
     def close_connection(self) -> None:
         """データベース接続を閉じる"""
         raise NotImplementedError("子クラスで実装する必要があります")
 
 
+class _SQLiteThreadConnection(sqlite3.Connection):
+    """
+    スレッドごとに開くSQLite接続
+    弱参照で管理できるようにサブクラス化し、再利用するカーソルとtransaction()の入れ子の深さを保持する
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.shared_cursor = self.cursor()
+        self.savepoint_depth = 0
+
+
 class SQLiteDatabaseHandler(BaseDatabaseHandler):
-    """SQLiteデータベースを操作するためのハンドラー"""
+    """
+    SQLiteデータベースを操作するためのハンドラー
+    接続はスレッドごとに開き、WALモードで複数スレッドからの読み込みを並行して行えるようにする
+    """
 
     def __init__(self, database_path: str, init_sql_path: str | None = None) -> None:
         """
@@ -77,24 +178,26 @@ class SQLiteDatabaseHandler(BaseDatabaseHandler):
             database_path: SQLiteデータベースファイルのパス
             init_sql_path: 初期化SQLスクリプトのパス（オプション）
         """
-        self.connection: sqlite3.Connection | None = None
+        self._local = threading.local()
+        self._connections: weakref.WeakSet[_SQLiteThreadConnection] = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._connected = False
         self.database_path = self.get_db_path(database_path)
         self.init_sql_path = init_sql_path
         self.connect()
 
-    def get_db_path(self, db_path: str) -> str:
+    @staticmethod
+    def get_db_path(db_path: str) -> str:
         """
         相対パスから絶対パスを生成する
 
         Args:
-            db_path: データベースの相対パス
+            db_path: データベースの相対パス（先頭の / の有無は問わない）
 
         Returns:
             str: データベースファイルの絶対パス
         """
-        app_dir = Path(__file__).resolve().parent.parent.parent
-        full_path = str(app_dir) + db_path
-        return full_path
+        return os.path.join(_APP_DIR, db_path.lstrip("/"))
 
     def connect(self) -> None:
         """
@@ -104,10 +207,11 @@ class SQLiteDatabaseHandler(BaseDatabaseHandler):
         try:
             if not Path(self.database_path).exists():
                 self._create_database()
-            self.connection = sqlite3.connect(self.database_path, check_same_thread=False)
+            self._local.connection = self._open_connection()
+            self._connected = True
             logger.info("SQLite connection initialized successfully.")
         except sqlite3.Error as e:
-            logger.error(f"SQLite connection failed: {e}")
+            logger.error("SQLite connection failed: %s", e)
             raise
 
     def is_connected(self) -> bool:
@@ -117,7 +221,43 @@ class SQLiteDatabaseHandler(BaseDatabaseHandler):
         Returns:
             bool: 接続が有効な場合はTrue、それ以外はFalse
         """
-        return self.connection is not None
+        return self._connected
+
+    def _open_connection(self) -> _SQLiteThreadConnection:
+        """
+        新しいSQLite接続を開いてPRAGMAを適用する
+
+        Returns:
+            _SQLiteThreadConnection: 開いた接続
+        """
+        # close_connection()で別スレッドから閉じられるようにcheck_same_threadは無効にする
+        # isolation_level=Noneで自動コミットとし、読み込みで暗黙のBEGIN/COMMITが発行されないようにする
+        connection = sqlite3.connect(
+            self.database_path,
+            factory=_SQLiteThreadConnection,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        connection.executescript(SQLITE_PRAGMAS)
+        with self._lock:
+            self._connections.add(connection)
+        return connection
+
+    def _get_connection(self) -> _SQLiteThreadConnection:
+        """
+        現在のスレッド用の接続を返す
+        まだ接続を開いていないスレッドでは新しく開く
+
+        Returns:
+            _SQLiteThreadConnection: 現在のスレッドの接続
+        """
+        connection: _SQLiteThreadConnection | None = getattr(self._local, "connection", None)
+        if connection is None or connection not in self._connections:
+            if not self._connected:
+                raise RuntimeError("Database connection is not established")
+            connection = self._open_connection()
+            self._local.connection = connection
+        return connection
 
     def _create_database(self) -> None:
         """
@@ -129,12 +269,15 @@ class SQLiteDatabaseHandler(BaseDatabaseHandler):
 
         if self.init_sql_path:
             try:
+                init_sql = _INIT_SQL_CACHE.get(self.init_sql_path)
+                if init_sql is None:
+                    init_sql = Path(self.init_sql_path).read_text(encoding="utf-8")
+                    _INIT_SQL_CACHE[self.init_sql_path] = init_sql
                 with sqlite3.connect(self.database_path) as connection:
-                    with open(self.init_sql_path, encoding="utf-8") as f:
-                        connection.executescript(f.read())
+                    connection.executescript(init_sql)
                 logger.info("SQLite database created with initial schema.")
             except (OSError, sqlite3.Error) as e:
-                logger.error(f"Failed to initialize database: {e}")
+                logger.error("Failed to initialize database: %s", e)
                 raise
         else:
             logger.warning("No initial schema file specified. Creating empty database.")
@@ -142,23 +285,49 @@ class SQLiteDatabaseHandler(BaseDatabaseHandler):
     def execute_query(self, query: str, params: tuple[Any, ...] | None = None) -> None:
         """
         クエリを実行（データ挿入、更新、削除）
+        begin()でトランザクションを開始していない場合は実行ごとにコミットされる
 
         Args:
             query: 実行するSQLクエリ
             params: クエリパラメータ
         """
-        if not self.connection:
-            raise RuntimeError("Database connection is not established")
+        connection = self._get_connection()
+
+        # SQLite形式に変換（%s -> ?）
+        query = _to_sqlite_paramstyle(query)
+
+        try:
+            connection.shared_cursor.execute(query, params or ())
+        except sqlite3.Error as e:
+            logger.error("Query execution failed: %s", e)
+            raise
+
+    def execute_many(self, query: str, seq_of_params: Sequence[tuple[Any, ...]]) -> None:
+        """
+        同じクエリを複数のパラメータでまとめて実行（一括挿入など）
+
+        Args:
+            query: 実行するSQLクエリ
+            seq_of_params: クエリパラメータのシーケンス
+        """
+        connection = self._get_connection()
 
         # SQLite形式に変換（%s -> ?）
-        query = query.replace("%s", "?")
+        query = _to_sqlite_paramstyle(query)
 
+        # トランザクション外で呼ばれた場合は、全件を1回のコミットにまとめる
+        own_transaction = not connection.in_transaction
         try:
-            with self.connection:
-                cursor = self.connection.cursor()
-                cursor.execute(query, params or [])
+            cursor = connection.shared_cursor
+            if own_transaction:
+                cursor.execute("BEGIN")
+            cursor.executemany(query, seq_of_params)
+            if own_transaction:
+                connection.commit()
         except sqlite3.Error as e:
-            logger.error(f"Query execution failed: {e}")
+            logger.error("Query execution failed: %s", e)
+            if own_transaction:
+                connection.rollback()
             raise
 
     def fetch_query(self, query: str, params: tuple[Any, ...] | None = None) -> list[tuple[Any, ...]]:
@@ -172,55 +341,176 @@ class SQLiteDatabaseHandler(BaseDatabaseHandler):
         Returns:
             List[Tuple[Any, ...]]: クエリ結果の行のリスト
         """
-        if not self.connection:
-            raise RuntimeError("Database connection is not established")
+        connection = self._get_connection()
+
+        # SQLite形式に変換（%s -> ?）
+        query = _to_sqlite_paramstyle(query)
+
+        try:
+            cursor = connection.shared_cursor
+            cursor.execute(query, params or ())
+            return cursor.fetchall()
+        except sqlite3.Error as e:
+            logger.error("Query execution failed: %s", e)
+            raise
+
+    def iter_query(
+        self, query: str, params: tuple[Any, ...] | None = None, chunk_size: int = 1000
+    ) -> Generator[tuple[Any, ...], None, None]:
+        """
+        クエリを実行して結果を1行ずつ返す
+
+        Args:
+            query: 実行するSQLクエリ
+            params: クエリパラメータ
+            chunk_size: 一度に読み込む行数
+
+        Yields:
+            Tuple[Any, ...]: クエリ結果の行
+        """
+        connection = self._get_connection()
 
         # SQLite形式に変換（%s -> ?）
-        query = query.replace("%s", "?")
+        query = _to_sqlite_paramstyle(query)
 
+        # 読み込み途中で他のクエリが実行されても影響を受けないよう、共有カーソルとは別のカーソルを使う
+        cursor = connection.cursor()
+        cursor.arraysize = chunk_size
         try:
-            with self.connection:
-                cursor = self.connection.cursor()
-                cursor.execute(query, params or [])
-                return cursor.fetchall()
+            cursor.execute(query, params or ())
+            for rows in iter(cursor.fetchmany, []):
+                yield from rows
         except sqlite3.Error as e:
-            logger.error(f"Query execution failed: {e}")
+            logger.error("Query execution failed: %s", e)
+            raise
+        finally:
+            cursor.close()
+
+    def begin(self) -> None:
+        """
+        現在のスレッドでトランザクションを開始する
+        commit()またはrollback()を呼ぶまで、実行したクエリはまとめて1回でコミットされる
+        """
+        connection = self._get_connection()
+        if connection.in_transaction:
+            raise RuntimeError("Transaction is already in progress")
+
+        connection.shared_cursor.execute("BEGIN")
+
+    def commit(self) -> None:
+        """現在のスレッドのトランザクションをコミットする"""
+        self._get_connection().commit()
+
+    def rollback(self) -> None:
+        """現在のスレッドのトランザクションをロールバックする"""
+        self._get_connection().rollback()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        トランザクションを開始するコンテキストマネージャ
+        ブロック内で実行したクエリは終了時にまとめてコミットされ、例外が発生した場合はロールバックする
+        トランザクション中に入れ子で呼ばれた場合はセーブポイントになる
+        """
+        connection = self._get_connection()
+        if connection.in_transaction:
+            yield from self._savepoint(connection)
+            return
+
+        self.begin()
+        try:
+            yield
+            # コミットに失敗した場合もロールバックし、接続をトランザクション中のまま残さない
+            self.commit()
+        except BaseException:
+            self.rollback()
             raise
 
+    def _savepoint(self, connection: _SQLiteThreadConnection) -> Iterator[None]:
+        """
+        セーブポイントを作成し、ブロックが正常に終了すれば解放、例外が発生した場合はセーブポイントまで戻す
+
+        Args:
+            connection: トランザクション中の接続
+        """
+        connection.savepoint_depth += 1
+        name = f"sp_{connection.savepoint_depth}"
+        cursor = connection.shared_cursor
+        cursor.execute(f"SAVEPOINT {name}")
+        try:
+            yield
+            cursor.execute(f"RELEASE SAVEPOINT {name}")
+        except BaseException:
+            # エラーによってトランザクション全体が既に終了している場合は戻す先がない
+            if connection.in_transaction:
+                cursor.execute(f"ROLLBACK TO SAVEPOINT {name}")
+                cursor.execute(f"RELEASE SAVEPOINT {name}")
+            raise
+        finally:
+            connection.savepoint_depth -= 1
+
     def close_connection(self) -> None:
-        """SQLite接続を閉じる"""
-        if self.connection:
+        """すべてのスレッドのSQLite接続を閉じる"""
+        if not self._connected:
+            return
+
+        self._connected = False
+        with self._lock:
+            connections = list(self._connections)
+            self._connections.clear()
+
+        for connection in connections:
             try:
-                self.connection.close()
-                self.connection = None
-                logger.info("SQLite connection closed.")
+                connection.close()
             except sqlite3.Error as e:
-                logger.error(f"Failed to close SQLite connection: {e}")
+                logger.error("Failed to close SQLite connection: %s", e)
+        logger.info("SQLite connection closed.")
 
 
 class PostgreSQLDatabaseHandler(BaseDatabaseHandler):
     """PostgreSQLデータベースを操作するためのハンドラー"""
 
-    def __init__(self, conninfo: str) -> None:
+    def __init__(self, conninfo: str, minconn: int = 1, maxconn: int = 20) -> None:
         """
         PostgreSQLDatabaseHandlerを初期化する
 
         Args:
             conninfo: PostgreSQL接続情報文字列
+            minconn: コネクションプールで維持する最小接続数
+            maxconn: コネクションプールの最大接続数
         """
         self.conninfo = conninfo
-        self.pool: psycopg2.pool.SimpleConnectionPool | None = None
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.pool: ConnectionPool | None = None
+        # transaction()の中ではスレッドごとに同じ接続を使い回す
+        self._local = threading.local()
         self.connect()
 
     def connect(self) -> None:
         """PostgreSQLデータベースに接続する"""
         try:
-            self.pool = psycopg2.pool.SimpleConnectionPool(minconn=1, maxconn=20, dsn=self.conninfo)
-            if not self.pool:
-                raise psycopg2.DatabaseError("Failed to create connection pool")
+            # 接続情報の誤りやサーバーの停止は、プールの再接続を待たずに実際のエラーとしてすぐに通知する
+            with psycopg.connect(self.conninfo):
+                pass
+
+            # 読み込みはBEGIN/COMMITを省くため自動コミットとする
+            # プリペアドステートメントは既定の閾値のままとし、繰り返し実行されるクエリだけを準備する
+            # （閾値を0にすると任意入力の複数文クエリが拡張プロトコルで拒否され、単発のクエリも往復が増える）
+            self.pool = ConnectionPool(
+                self.conninfo,
+                min_size=self.minconn,
+                max_size=self.maxconn,
+                kwargs={"autocommit": True},
+                open=True,
+            )
+            self.pool.wait(timeout=10.0)
             logger.info("PostgreSQL connection pool initialized.")
-        except psycopg2.Error as e:
-            logger.error(f"PostgreSQL connection failed: {e}")
+        except psycopg.Error as e:
+            logger.error("PostgreSQL connection failed: %s", e)
+            if self.pool:
+                self.pool.close()
+                self.pool = None
             raise
 
     def is_connected(self) -> bool:
@@ -240,22 +530,29 @@ class PostgreSQLDatabaseHandler(BaseDatabaseHandler):
             query: 実行するSQLクエリ
             params: クエリパラメータ
         """
-        if not self.pool:
-            raise RuntimeError("Database connection pool is not established")
+        try:
+            with self._connection() as conn:
+                conn.execute(query, params)
+        except psycopg.Error as e:
+            logger.error("Query execution failed: %s", e)
+            raise
+
+    def execute_many(self, query: str, seq_of_params: Sequence[tuple[Any, ...]]) -> None:
+        """
+        同じクエリを複数のパラメータでまとめて実行（一括挿入など）
+        パイプラインで応答を待たずに送信し、往復回数を減らす
 
-        conn = None
+        Args:
+            query: 実行するSQLクエリ
+            seq_of_params: クエリパラメータのシーケンス
+        """
         try:
-            conn = self.pool.getconn()
-            with conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query, params)
-                    conn.commit()
-        except psycopg2.Error as e:
-            logger.error(f"Query execution failed: {e}")
+            with self._connection() as conn:
+                with conn.transaction(), conn.pipeline(), conn.cursor() as cursor:
+                    cursor.executemany(query, seq_of_params)
+        except psycopg.Error as e:
+            logger.error("Query execution failed: %s", e)
             raise
-        finally:
-            if conn and self.pool:
-                self.pool.putconn(conn)
 
     def fetch_query(self, query: str, params: tuple[Any, ...] | None = None) -> list[tuple[Any, ...]]:
         """
@@ -268,32 +565,84 @@ class PostgreSQLDatabaseHandler(BaseDatabaseHandler):
         Returns:
             List[Tuple[Any, ...]]: クエリ結果の行のリスト
         """
-        if not self.pool:
-            raise RuntimeError("Database connection pool is not established")
+        try:
+            with self._connection() as conn:
+                return conn.execute(query, params).fetchall()
+        except psycopg.Error as e:
+            logger.error("Query execution failed: %s", e)
+            raise
+
+    def iter_query(
+        self, query: str, params: tuple[Any, ...] | None = None, chunk_size: int = 1000
+    ) -> Generator[tuple[Any, ...], None, None]:
+        """
+        クエリを実行して結果を1行ずつ返す
+        サーバーサイドカーソルを使い、サーバーからchunk_size行ずつ受け取る
+
+        Args:
+            query: 実行するSQLクエリ
+            params: クエリパラメータ
+            chunk_size: 一度に読み込む行数
 
-        conn = None
+        Yields:
+            Tuple[Any, ...]: クエリ結果の行
+        """
         try:
-            conn = self.pool.getconn()
-            with conn:
-                with conn.cursor() as cursor:
+            with self._connection() as conn:
+                # 名前付きカーソルはトランザクション内でのみ有効なため、読み終えるまで接続を保持する
+                with conn.transaction(), conn.cursor(name="stream") as cursor:
+                    cursor.itersize = chunk_size
                     cursor.execute(query, params)
-                    return cast(list[tuple[Any, ...]], cursor.fetchall())
-        except psycopg2.Error as e:
-            logger.error(f"Query execution failed: {e}")
+                    yield from cursor
+        except psycopg.Error as e:
+            logger.error("Query execution failed: %s", e)
             raise
-        finally:
-            if conn and self.pool:
-                self.pool.putconn(conn)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        トランザクションを開始するコンテキストマネージャ
+        ブロック内で同じスレッドから実行したクエリは1つの接続上で実行され、終了時にまとめてコミットされる
+        例外が発生した場合はロールバックする
+        """
+        with self._connection() as conn:
+            outer = getattr(self._local, "connection", None)
+            self._local.connection = conn
+            try:
+                # 入れ子の場合はセーブポイントになる
+                with conn.transaction():
+                    yield
+            finally:
+                self._local.connection = outer
+
+    @contextmanager
+    def _connection(self) -> Iterator[psycopg.Connection[Any]]:
+        """
+        クエリを実行する接続を返すコンテキストマネージャ
+        transaction()の中であればその接続を、そうでなければプールから借りた接続を返す
+
+        Yields:
+            psycopg.Connection: クエリを実行する接続
+        """
+        conn = getattr(self._local, "connection", None)
+        if conn is not None:
+            yield conn
+            return
+
+        if not self.pool:
+            raise RuntimeError("Database connection pool is not established")
+        with self.pool.connection() as conn:
+            yield conn
 
     def close_connection(self) -> None:
         """PostgreSQL接続を閉じる"""
         if self.pool:
             try:
-                self.pool.closeall()
+                self.pool.close()
                 self.pool = None
                 logger.info("PostgreSQL connection pool closed.")
-            except psycopg2.Error as e:
-                logger.error(f"Failed to close PostgreSQL connection pool: {e}")
+            except psycopg.Error as e:
+                logger.error("Failed to close PostgreSQL connection pool: %s", e)
 
 
 class DatabaseHandler:
@@ -338,19 +687,27 @@ class DatabaseHandler:
             self.use_postgres = use_postgres
 
         if self.use_postgres:
-            conninfo = (
-                f"postgresql://{os.environ['POSTGRES_USER']}:"
-                f"{os.environ['POSTGRES_PASSWORD']}@"
-                f"{os.environ['POSTGRES_HOST']}:"
-                f"{os.environ['POSTGRES_PORT']}/"
-                f"{os.environ['POSTGRES_DB_NAME']}?sslmode=disable"
+            # make_conninfoでパスワード等に含まれる記号も正しくエスケープする
+            conninfo = make_conninfo(
+                user=os.environ["POSTGRES_USER"],
+                password=os.environ["POSTGRES_PASSWORD"],
+                host=os.environ["POSTGRES_HOST"],
+                port=os.environ["POSTGRES_PORT"],
+                dbname=os.environ["POSTGRES_DB_NAME"],
+                sslmode="disable",
             )
-            self.handler = PostgreSQLDatabaseHandler(conninfo)
+            self.handler = PostgreSQLDatabaseHandler(conninfo, POSTGRES_MIN_CONN, POSTGRES_MAX_CONN)
         else:
             database_path = os.environ["SQLITE_DB_PATH"]
             init_sql_path = "db/sqlite/init/1_init.sql"
             self.handler = SQLiteDatabaseHandler(database_path, init_sql_path)
 
+        # 接続済みのハンドラのメソッドをインスタンス属性に束縛し、クエリごとのハンドラ確認と呼び出しの段数を省く
+        self.execute_query = self.handler.execute_query  # type: ignore[method-assign]
+        self.execute_many = self.handler.execute_many  # type: ignore[method-assign]
+        self.fetch_query = self.handler.fetch_query  # type: ignore[method-assign]
+        self.iter_query = self.handler.iter_query  # type: ignore[method-assign]
+
     def reconnect(self, use_postgres: bool = False) -> None:
         """
         データベース接続を再接続する
@@ -384,6 +741,18 @@ class DatabaseHandler:
             raise RuntimeError("Database handler is not initialized")
         self.handler.execute_query(query, params)
 
+    def execute_many(self, query: str, seq_of_params: Sequence[tuple[Any, ...]]) -> None:
+        """
+        同じクエリを複数のパラメータでまとめて実行（一括挿入など）
+
+        Args:
+            query: 実行するSQLクエリ
+            seq_of_params: クエリパラメータのシーケンス
+        """
+        if not self.handler:
+            raise RuntimeError("Database handler is not initialized")
+        self.handler.execute_many(query, seq_of_params)
+
     def fetch_query(self, query: str, params: tuple[Any, ...] | None = None) -> list[tuple[Any, ...]]:
         """
         クエリを実行して結果を取得
@@ -399,6 +768,36 @@ class DatabaseHandler:
             raise RuntimeError("Database handler is not initialized")
         return self.handler.fetch_query(query, params)
 
+    def iter_query(
+        self, query: str, params: tuple[Any, ...] | None = None, chunk_size: int = 1000
+    ) -> Generator[tuple[Any, ...], None, None]:
+        """
+        クエリを実行して結果を1行ずつ返す
+
+        Args:
+            query: 実行するSQLクエリ
+            params: クエリパラメータ
+            chunk_size: 一度に読み込む行数
+
+        Returns:
+            Generator[Tuple[Any, ...], None, None]: クエリ結果の行のジェネレータ（途中でやめる場合はclose()する）
+        """
+        if not self.handler:
+            raise RuntimeError("Database handler is not initialized")
+        return self.handler.iter_query(query, params, chunk_size)
+
+    def transaction(self) -> AbstractContextManager[None]:
+        """
+        トランザクションを開始するコンテキストマネージャを返す
+        複数の更新をまとめて1回でコミットする場合に使用する
+
+        Returns:
+            AbstractContextManager[None]: トランザクションのコンテキストマネージャ
+        """
+        if not self.handler:
+            raise RuntimeError("Database handler is not initialized")
+        return self.handler.transaction()
+
     def close_connection(self) -> None:
         """データベース接続を閉じる"""
         if self.handler:
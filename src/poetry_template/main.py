@@ -1,4 +1,8 @@
+import asyncio
 import logging
+from contextlib import closing
+from functools import lru_cache, partial
+from itertools import islice
 
 import flet as ft
 
@@ -8,6 +12,39 @@ from poetry_template.db import DatabaseHandler
 logging.basicConfig(level=logging.INFO)
 
 MAX_CONTENT_LENGTH = 50
+PAGE_SIZE = 200  # 一度に表示する最大行数
+
+# ドキュメントテーブルの列（ソート列のインデックスと対応する）
+DOCUMENT_COLUMNS = ("document_id", "title", "content", "created_at", "updated_at")
+
+# クエリ画面のサンプルクエリ（ボタンの並び順と対応する）
+_SAMPLE_QUERIES = (
+    "SELECT * FROM documents",
+    "SELECT * FROM documents WHERE title LIKE '%検索語%'",
+    "INSERT INTO documents (title, content) VALUES ('新規タイトル', '新規内容')",
+    "UPDATE documents SET title = '更新タイトル', content = '更新内容' WHERE document_id = 1",
+    "DELETE FROM documents WHERE document_id = 1",
+)
+
+# ビュー構築で繰り返し参照する列挙値の別名
+_COL_OUTLINE = ft.Colors.OUTLINE
+_COL_OUTLINE_VAR = ft.Colors.OUTLINE_VARIANT
+_ICON_REFRESH = ft.Icons.REFRESH_ROUNDED
+_ICON_ADD = ft.Icons.ADD
+_MA_CENTER = ft.MainAxisAlignment.CENTER
+_CA_CENTER = ft.CrossAxisAlignment.CENTER
+_FW_BOLD = ft.FontWeight.BOLD
+_FW_500 = ft.FontWeight.W_500
+
+
+def truncate_text(text: str | None, length: int = MAX_CONTENT_LENGTH) -> str:
+    """テキストを指定した長さで切り詰める"""
+    if text is None:
+        return ""
+    # 大半の値は上限に収まるため、切り詰め不要ならそのまま返す
+    if len(text) <= length:
+        return text
+    return text[:length] + "..."
 
 
 class DocumentsView:
@@ -40,6 +77,15 @@ class DocumentsView:
         )
         self.search_mode = "both" # 検索モード(default: both)
 
+        # ページ送り
+        self.offset = 0
+        self.prev_page_button = ft.IconButton(
+            icon=ft.Icons.CHEVRON_LEFT, tooltip="前のページ", on_click=self.on_prev_page, disabled=True
+        )
+        self.next_page_button = ft.IconButton(
+            icon=ft.Icons.CHEVRON_RIGHT, tooltip="次のページ", on_click=self.on_next_page, disabled=True
+        )
+
         # ドキュメントテーブルの定義
         self.documents_table = ft.DataTable(
             columns=[
@@ -50,10 +96,10 @@ class DocumentsView:
                 ft.DataColumn(ft.Text("更新日時"), on_sort=self.on_sort_changed),
             ],
             rows=[],
-            border=ft.border.all(1, ft.Colors.OUTLINE),
+            border=ft.border.all(1, _COL_OUTLINE),
             border_radius=10,
-            vertical_lines=ft.border.BorderSide(1, ft.Colors.OUTLINE_VARIANT),
-            horizontal_lines=ft.border.BorderSide(1, ft.Colors.OUTLINE_VARIANT),
+            vertical_lines=ft.border.BorderSide(1, _COL_OUTLINE_VAR),
+            horizontal_lines=ft.border.BorderSide(1, _COL_OUTLINE_VAR),
             sort_column_index=self.sort_column_index,
             sort_ascending=self.sort_ascending,
             heading_row_height=70,
@@ -64,16 +110,27 @@ class DocumentsView:
     def on_sort_changed(self, e: ft.ControlEvent) -> None:
         self.sort_column_index = e.column_index
         self.sort_ascending = e.ascending
+        self.offset = 0
         self.parent.load_documents()
 
     def on_search_changed(self, e: ft.ControlEvent) -> None:
+        self.offset = 0
         self.parent.load_documents(search_text=self.search_field.value)
 
     def set_search_mode(self, mode: str) -> None:
         self.search_mode = mode
         if self.search_field.value:
+            self.offset = 0
             self.parent.load_documents(search_text=self.search_field.value)
 
+    def on_prev_page(self, e: ft.ControlEvent) -> None:
+        self.offset = max(0, self.offset - PAGE_SIZE)
+        self.parent.load_documents(search_text=self.search_field.value or "")
+
+    def on_next_page(self, e: ft.ControlEvent) -> None:
+        self.offset += PAGE_SIZE
+        self.parent.load_documents(search_text=self.search_field.value or "")
+
     def get_view(self, page: ft.Page) -> ft.View:
         """ドキュメント一覧画面のビューを返す"""
         return ft.View(
@@ -84,9 +141,9 @@ class DocumentsView:
                     center_title=True,
                     actions=[
                         ft.IconButton(
-                            icon=ft.Icons.REFRESH_ROUNDED,
+                            icon=_ICON_REFRESH,
                             tooltip="更新",
-                            on_click=lambda e: self.parent.load_documents(),
+                            on_click=lambda e: self.parent.reload_documents(),
                         ),
                         ft.PopupMenuButton(
                             items=[
@@ -111,13 +168,17 @@ class DocumentsView:
                                 padding=20,
                                 expand=True,
                             ),
+                            ft.Row(
+                                [self.prev_page_button, self.next_page_button],
+                                alignment=_MA_CENTER,
+                            ),
                         ]
                     ),
                     padding=10,
                     expand=True,
                 ),
                 ft.FloatingActionButton(
-                    icon=ft.Icons.ADD, on_click=self.parent.create_new_document, tooltip="新規ドキュメント作成"
+                    icon=_ICON_ADD, on_click=self.parent.create_new_document, tooltip="新規ドキュメント作成"
                 ),
                 ft.Container(self.parent.status_text, padding=10),
             ],
@@ -148,14 +209,14 @@ class ConnectionView:
                                 content=ft.Container(
                                     ft.Column(
                                         [
-                                            ft.Text("データベースタイプを選択", size=20, weight=ft.FontWeight.BOLD),
+                                            ft.Text("データベースタイプを選択", size=20, weight=_FW_BOLD),
                                             ft.Row(
                                                 [
-                                                    ft.Text("SQLite", weight=ft.FontWeight.W_500),
+                                                    ft.Text("SQLite", weight=_FW_500),
                                                     self.db_type_switch,
-                                                    ft.Text("PostgreSQL", weight=ft.FontWeight.W_500),
+                                                    ft.Text("PostgreSQL", weight=_FW_500),
                                                 ],
-                                                alignment=ft.MainAxisAlignment.CENTER,
+                                                alignment=_MA_CENTER,
                                             ),
                                             ft.ElevatedButton(
                                                 "接続",
@@ -164,8 +225,8 @@ class ConnectionView:
                                                 width=200,
                                             ),
                                         ],
-                                        alignment=ft.MainAxisAlignment.CENTER,
-                                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                                        alignment=_MA_CENTER,
+                                        horizontal_alignment=_CA_CENTER,
                                     ),
                                     padding=30,
                                     width=400,
@@ -173,8 +234,8 @@ class ConnectionView:
                                 elevation=5,
                             ),
                         ],
-                        alignment=ft.MainAxisAlignment.CENTER,
-                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                        alignment=_MA_CENTER,
+                        horizontal_alignment=_CA_CENTER,
                     ),
                     alignment=ft.alignment.center,
                     expand=True,
@@ -199,6 +260,7 @@ class QueryView:
             min_lines=3,
             max_lines=8,
             hint_text="例: SELECT * FROM documents WHERE title LIKE '%検索語%'",
+            on_change=self._on_query_changed,
             expand=True,
         )
 
@@ -208,58 +270,68 @@ class QueryView:
                 ft.DataColumn(ft.Text("結果"))
             ],
             rows=[],
-            border=ft.border.all(1, ft.Colors.OUTLINE),
+            border=ft.border.all(1, _COL_OUTLINE),
             border_radius=10,
         )
 
         self.query_result_text = ft.Text("クエリ実行結果がここに表示されます")
+        self.execute_button = ft.ElevatedButton("実行", icon=ft.Icons.PLAY_ARROW, on_click=self.execute_custom_query)
+
+        # 直前にテーブルに表示した結果
+        self._last_results: list[tuple] | None = None
+
+        # SELECTの結果のページ送り（入力欄の内容ではなく、結果を表示しているクエリを使う）
+        self.offset = 0
+        self._paged_query: str | None = None
+        self.prev_page_button = ft.IconButton(
+            icon=ft.Icons.CHEVRON_LEFT, tooltip="前のページ", on_click=self.on_prev_page, disabled=True
+        )
+        self.next_page_button = ft.IconButton(
+            icon=ft.Icons.CHEVRON_RIGHT, tooltip="次のページ", on_click=self.on_next_page, disabled=True
+        )
 
         self.sample_buttons = ft.Column(
             [
                 ft.Text("サンプルクエリ"),
                 ft.Row(
                     [
-                        ft.ElevatedButton(
-                            "全件検索",
-                            on_click=lambda e: self.set_sample_query("SELECT * FROM documents"),
-                        ),
-                        ft.ElevatedButton(
-                            "タイトル検索",
-                            on_click=lambda e: self.set_sample_query(
-                                "SELECT * FROM documents WHERE title LIKE '%検索語%'"
-                            ),
-                        ),
+                        ft.ElevatedButton("全件検索", on_click=partial(self._set_sample, 0)),
+                        ft.ElevatedButton("タイトル検索", on_click=partial(self._set_sample, 1)),
                     ],
                     wrap=True,
                 ),
                 ft.Row(
                     [
-                        ft.ElevatedButton(
-                            "新規追加",
-                            on_click=lambda e: self.set_sample_query(
-                                "INSERT INTO documents (title, content) VALUES ('新規タイトル', '新規内容')"
-                            ),
-                        ),
-                        ft.ElevatedButton(
-                            "更新",
-                            on_click=lambda e: self.set_sample_query(
-                                "UPDATE documents SET title = '更新タイトル', content = '更新内容' WHERE document_id = 1" # noqa
-                            ),
-                        ),
-                        ft.ElevatedButton(
-                            "削除",
-                            on_click=lambda e: self.set_sample_query("DELETE FROM documents WHERE document_id = 1"),
-                        ),
+                        ft.ElevatedButton("新規追加", on_click=partial(self._set_sample, 2)),
+                        ft.ElevatedButton("更新", on_click=partial(self._set_sample, 3)),
+                        ft.ElevatedButton("削除", on_click=partial(self._set_sample, 4)),
                     ]
                 ),
             ],
         )
 
+    def _set_sample(self, index: int, e: ft.ControlEvent) -> None:
+        """サンプルクエリのボタンが押されたときに、対応するクエリをセットする"""
+        self.set_sample_query(_SAMPLE_QUERIES[index])
+
     def set_sample_query(self, query: str) -> None:
         """サンプルクエリをセットする"""
         self.sql_query_field.value = query
+        self._disable_paging()
         self.parent.page.update()
 
+    def _on_query_changed(self, e: ft.ControlEvent) -> None:
+        """クエリが編集されたら、表示中の結果のページ送りを無効にする"""
+        if self._paged_query is not None:
+            self._disable_paging()
+            self.parent.page.update()
+
+    def _disable_paging(self) -> None:
+        """ページ送りの対象のクエリを破棄し、ページ送りのボタンを無効にする"""
+        self._paged_query = None
+        self.prev_page_button.disabled = True
+        self.next_page_button.disabled = True
+
     def get_view(self, page: ft.Page) -> ft.View:
         """SQLクエリ実行画面のビューを返す"""
         return ft.View(
@@ -285,10 +357,8 @@ class QueryView:
                                         self.sample_buttons,
                                         ft.Divider(),
                                         self.sql_query_field,
-                                        ft.ElevatedButton(
-                                            "実行", icon=ft.Icons.PLAY_ARROW, on_click=self.execute_custom_query
-                                        ),
-                                        self.query_result_text,
+                                        self.execute_button,
+                                        ft.Row([self.query_result_text, self.prev_page_button, self.next_page_button]),
                                         ft.Container(
                                             self.result_table,
                                             expand=True,
@@ -310,57 +380,105 @@ class QueryView:
 
     def _refresh_result_table(self, results: list[tuple]) -> str:
         """クエリ結果のテーブルを更新する"""
-        if len(results) > 0:
-            # カラム名を取得（ここでは仮にインデックスを使用）
-            columns = [f"列{i+1}" for i in range(len(results[0]))]
-            self.result_table.columns = [ft.DataColumn(ft.Text(col)) for col in columns]
-
-            self.result_table.rows = [
-                ft.DataRow(cells=[ft.DataCell(ft.Text(str(cell))) for cell in row]) for row in results
-            ]
-            result_str = f"{len(results)}行が選択されました"
-        else:
+        row_count = len(results)
+        if not row_count:
             self.result_table.rows = []
-            result_str = "0行が選択されました"
+            return "0行が選択されました"
 
-        return result_str
+        # 表示済みの結果と全行が一致する場合はテーブルを作り直さない
+        if results == self._last_results and self.result_table.rows:
+            return f"{row_count}行が選択されました (キャッシュ)"
+        self._last_results = results
 
+        data_column, data_row, data_cell, text = ft.DataColumn, ft.DataRow, ft.DataCell, ft.Text
+        # カラム名を取得（ここでは仮にインデックスを使用）
+        self.result_table.columns = [data_column(text(f"列{i + 1}")) for i in range(len(results[0]))]
+        # 各行の値はmapでまとめて文字列に変換する
+        self.result_table.rows = [data_row(cells=[data_cell(text(cell)) for cell in map(str, row)]) for row in results]
+        return f"{row_count}行が選択されました"
 
-    def execute_custom_query(self, e: ft.ControlEvent) -> None:
+    def _fetch_page(self, query: str) -> list[tuple]:
+        """
+        SELECTの結果から現在のページの行を取得する（別スレッドで実行する）
+        ユーザーのクエリは書き換えずに結果を先頭から読み進め、次のページの有無を判定するため1行多く取り出す
+
+        Args:
+            query: 実行するSELECTクエリ
+
+        Returns:
+            list[tuple]: 現在のページの行（次のページがある場合はPAGE_SIZE + 1行）
+        """
+        rows = self.parent.db_handler.iter_query(query, chunk_size=PAGE_SIZE + 1)
+        with closing(rows):
+            return list(islice(rows, self.offset, self.offset + PAGE_SIZE + 1))
+
+    async def execute_custom_query(self, e: ft.ControlEvent) -> None:
         """SQLクエリを実行し結果を表示する"""
+        query = self.sql_query_field.value.strip()
+        logging.info("Executing query: %s", query)
+        if query == "":
+            self.query_result_text.value = "クエリを入力してください"
+            self.parent.page.update()
+            return
+
+        self.offset = 0
+        await self._run_query(query)
+
+    async def on_prev_page(self, e: ft.ControlEvent) -> None:
+        if self._paged_query is None:
+            return
+        self.offset = max(0, self.offset - PAGE_SIZE)
+        await self._run_query(self._paged_query)
+
+    async def on_next_page(self, e: ft.ControlEvent) -> None:
+        if self._paged_query is None:
+            return
+        self.offset += PAGE_SIZE
+        await self._run_query(self._paged_query)
+
+    async def _run_query(self, query: str) -> None:
+        """
+        クエリを現在のページ位置で実行し結果を表示する
+        データベースへの問い合わせは別スレッドで行い、実行中は実行ボタンとページ送りを無効にする
+
+        Args:
+            query: 実行するSQLクエリ（前後の空白は除去済み）
+        """
         page: ft.Page = self.parent.page
+        self.execute_button.disabled = True
+        self._disable_paging()
+        page.update()
         try:
-            query = self.sql_query_field.value.strip()
-            logging.info(f"Executing query: {query}")
-            if query == "":
-                self.query_result_text.value = "クエリを入力してください"
-                page.update()
-                return
-
-            is_select = query.upper().startswith("SELECT")
+            # クエリ全体ではなく先頭6文字だけを大文字にして判定する（queryは前後の空白を除去済み）
+            is_select = query[:6].upper() == "SELECT"
 
             if is_select:
-                results = self.parent.db_handler.fetch_query(query)
+                rows = await asyncio.to_thread(self._fetch_page, query)
+                results = rows[:PAGE_SIZE]
+                self._paged_query = query
+                self.prev_page_button.disabled = self.offset == 0
+                self.next_page_button.disabled = len(rows) <= PAGE_SIZE
 
                 if results:
                     res = self._refresh_result_table(results)
+                    if self.offset or len(rows) > PAGE_SIZE:
+                        res += f"（{self.offset + 1}〜{self.offset + len(results)}行目）"
                     self.query_result_text.value = res
                 else:
                     self.result_table.rows = []
                     self.query_result_text.value = "0行が選択されました"
             else:
-                self.parent.db_handler.execute_query(query)
+                await asyncio.to_thread(self.parent.db_handler.execute_query, query)
+                # ドキュメント一覧は次に表示するときに読み込み直す
+                self.parent.invalidate_documents()
                 self.query_result_text.value = "クエリが実行されました"
-                results = self.parent.db_handler.fetch_query("SELECT * FROM documents")
-                if results:
-                    self._refresh_result_table(results)
-                else:
-                    self.result_table.rows = []
+                self.result_table.rows = []
 
         except Exception as err:
             self.query_result_text.value = f"エラー: {str(err)}"
             self.result_table.rows = []
 
+        self.execute_button.disabled = False
         page.update()
 
 
@@ -375,14 +493,9 @@ class DialogManager:
     def show_document_detail(self, doc_id: int) -> None:
         """ドキュメント詳細ダイアログを表示する"""
         page = self.parent.page
-        document = None
-        for doc in self.parent.current_documents:
-            if doc[0] == doc_id:
-                document = doc
-                break
-
-        if not document:
-            logging.warning(f"Document not found: {doc_id}")
+        document = self.parent.documents_by_id.get(doc_id)
+        if document is None:
+            logging.warning("Document not found: %s", doc_id)
             return
 
         edit_title_field = ft.TextField(label="タイトル", value=document[1])
@@ -442,13 +555,12 @@ class DialogManager:
                 "UPDATE documents SET title = %s, content = %s, updated_at = CURRENT_TIMESTAMP WHERE document_id = %s",
                 (title, content, doc_id),
             )
-            page.snack_bar = ft.SnackBar(ft.Text("ドキュメントを更新しました"))
-            page.snack_bar.open = True
+            self.parent.invalidate_documents()
+            self.parent.notify("ドキュメントを更新しました")
             page.close(dialog)
             self.parent.load_documents()
         except Exception as err:
-            page.snack_bar = ft.SnackBar(ft.Text(f"エラー: {str(err)}"))
-            page.snack_bar.open = True
+            self.parent.notify(f"エラー: {str(err)}")
         page.update()
 
     def _delete_document(self, e: ft.ControlEvent, doc_id: int, parent_dialog: ft.AlertDialog) -> None:
@@ -458,14 +570,13 @@ class DialogManager:
         def confirm_delete(e: ft.ControlEvent) -> None:
             try:
                 self.parent.db_handler.execute_query("DELETE FROM documents WHERE document_id = %s", (doc_id,))
-                page.snack_bar = ft.SnackBar(ft.Text("ドキュメントを削除しました"))
-                page.snack_bar.open = True
+                self.parent.invalidate_documents()
+                self.parent.notify("ドキュメントを削除しました")
                 page.close(confirm_dialog)
                 parent_dialog.open = False
                 self.parent.load_documents()
             except Exception as err:
-                page.snack_bar = ft.SnackBar(ft.Text(f"エラー: {str(err)}"))
-                page.snack_bar.open = True
+                self.parent.notify(f"エラー: {str(err)}")
             page.update()
 
         confirm_dialog: ft.AlertDialog = ft.AlertDialog(
@@ -511,21 +622,19 @@ class DialogManager:
             title = title_field.value
             content = content_field.value
             if not title:
-                page.snack_bar = ft.SnackBar(ft.Text("タイトルを入力してください"))
-                page.snack_bar.open = True
+                self.parent.notify("タイトルを入力してください")
                 page.update()
                 return
 
             self.parent.db_handler.execute_query(
                 "INSERT INTO documents (title, content) VALUES (%s, %s)", (title, content)
             )
-            page.snack_bar = ft.SnackBar(ft.Text("ドキュメントを作成しました"))
-            page.snack_bar.open = True
+            self.parent.invalidate_documents()
+            self.parent.notify("ドキュメントを作成しました")
             page.close(dialog)
             self.parent.load_documents()
         except Exception as err:
-            page.snack_bar = ft.SnackBar(ft.Text(f"エラー: {str(err)}"))
-            page.snack_bar.open = True
+            self.parent.notify(f"エラー: {str(err)}")
         page.update()
 
 
@@ -538,11 +647,21 @@ class DatabaseGUI:
         # データベース関連の初期化
         self.db_handler = DatabaseHandler()
         self.current_documents: list[tuple] = []
+        self.documents_by_id: dict[int, tuple] = {}  # ドキュメントIDから行を引くための索引
+        self._row_pool: list[ft.DataRow] = []  # ドキュメント一覧で使い回す行のコントロール
+        # ドキュメント一覧の取得結果のキャッシュ（データを変更したらinvalidate_documents()で破棄する）
+        self._cached_fetch_documents = lru_cache(maxsize=32)(self._fetch_documents)
+        self._documents_stale = False  # 表示中のドキュメント一覧がデータの変更前のものであればTrue
         self.is_postgres = False  # デフォルトDB
 
         # 内部状態
         self.page: ft.Page = None
+        self._views: dict[str, ft.View] = {}
+        self._suspend_update = False  # 直後に画面遷移で更新される場合はload_documentsでの更新を省く
         self.status_text = ft.Text("準備完了", size=12)
+        # 通知用のスナックバー（毎回作り直さず、メッセージだけを差し替えて使い回す）
+        self._snack_text = ft.Text("")
+        self._snack_bar = ft.SnackBar(self._snack_text)
 
         # 各画面を管理するクラスの初期化
         self.connection_view = ConnectionView(self)
@@ -559,21 +678,28 @@ class DatabaseGUI:
         page.title = "Study SQL"
         page.theme_mode = ft.ThemeMode.SYSTEM
         page.padding = 0
+        # 通知用のスナックバーは最初にオーバーレイへ追加しておき、通知のたびに追加や更新を行わない
+        page.overlay.append(self._snack_bar)
+
+        # 各画面のビューは一度だけ構築し、画面遷移時には使い回す
+        self._views = {
+            "/connect": self.connection_view.get_view(page),
+            "/documents": self.documents_view.get_view(page),
+            "/query": self.query_view.get_view(page),
+        }
 
         # ルーティング
         def route_change(e: ft.ControlEvent) -> None:
             """画面遷移を処理するコールバック関数"""
             page.views.clear()
-
-            if page.route == "/connect":
-                page.views.append(self.connection_view.get_view(page))
-            elif page.route == "/documents":
-                page.views.append(self.documents_view.get_view(page))
-            elif page.route == "/query":
-                page.views.append(self.query_view.get_view(page))
-            else:
-                page.views.append(self.connection_view.get_view(page))
-
+            page.views.append(self._views.get(page.route, self._views["/connect"]))
+            # クエリ画面などでデータが変更されていれば、表示する前にドキュメント一覧を読み込み直す
+            if page.route == "/documents" and self._documents_stale:
+                self._suspend_update = True
+                try:
+                    self.load_documents(search_text=self.documents_view.search_field.value or "")
+                finally:
+                    self._suspend_update = False
             page.update()
 
         page.on_route_change = route_change
@@ -582,10 +708,6 @@ class DatabaseGUI:
     def load_documents(self, search_text: str = "") -> None:
         """ドキュメント一覧をデータベースから読み込む"""
 
-        def truncate_text(text: str, length: int = 50) -> str:
-            text_safe = text or ""
-            return text_safe[:length] + "..." if len(text) > length else text_safe
-
         try:
             if self.db_handler.is_connected():
                 # データベースからドキュメントを取得
@@ -606,48 +728,122 @@ class DatabaseGUI:
                         query += " WHERE title LIKE %s OR content LIKE %s"
                         params = (search_param, search_param)
 
-                # クエリ実行
-                self.current_documents = (
-                    self.db_handler.fetch_query(query, params) if params else self.db_handler.fetch_query(query)
-                )
-
                 # ソート処理
                 sort_index = self.documents_view.sort_column_index
                 sort_ascending = self.documents_view.sort_ascending
 
-                # ソート列に応じたソート処理（None値を考慮）
-                self.current_documents.sort(
-                    key=lambda doc: (doc[sort_index] is None, doc[sort_index]), reverse=not sort_ascending
-                )
+                # ソート列に応じたソート処理（None値は昇順では末尾、降順では先頭）
+                # ページ単位で取得するため、ソートはデータベース側で行う
+                sort_column = DOCUMENT_COLUMNS[sort_index]
+                order = "ASC" if sort_ascending else "DESC"
+                query += f" ORDER BY {sort_column} IS NULL {order}, {sort_column} {order}, document_id"
+                query += " LIMIT %s OFFSET %s"
+
+                # クエリ実行（次のページの有無を判定するため1件多く取得する）
+                offset = self.documents_view.offset
+                rows = self._cached_fetch_documents(query, (*params, PAGE_SIZE + 1, offset))
+                # 削除などで現在のページが空になった場合は、ドキュメントのあるページまで戻る
+                while not rows and offset > 0:
+                    offset = max(0, offset - PAGE_SIZE)
+                    rows = self._cached_fetch_documents(query, (*params, PAGE_SIZE + 1, offset))
+                self.documents_view.offset = offset
+                self._documents_stale = False
+                has_next = len(rows) > PAGE_SIZE
+                self.current_documents = rows[:PAGE_SIZE]
+                self.documents_by_id = {doc[0]: doc for doc in self.current_documents}
 
                 # テーブル表示更新
-                self.documents_view.documents_table.rows.clear()
-                for doc in self.current_documents:
-                    self.documents_view.documents_table.rows.append(
-                        ft.DataRow(
-                            cells=[
-                                ft.DataCell(ft.Text(str(doc[0]))),  # ID
-                                ft.DataCell(ft.Text(truncate_text(doc[1], MAX_CONTENT_LENGTH))),  # Title
-                                ft.DataCell(ft.Text(truncate_text(doc[2], MAX_CONTENT_LENGTH), expand=True)),  # Content
-                                ft.DataCell(ft.Text(str(doc[3]))),  # Created
-                                ft.DataCell(ft.Text(str(doc[4]))),  # Updated
-                            ],
-                            on_select_changed=lambda e, doc_id=doc[0]: self.dialog_manager.show_document_detail(doc_id),
-                        )
-                    )
-                # ソート状態をテーブルに反映
+                self._update_documents_table()
+                # ソート状態とページ送りの状態をテーブルに反映
                 self.documents_view.documents_table.sort_column_index = sort_index
                 self.documents_view.documents_table.sort_ascending = sort_ascending
-
-                if search_text:
-                    self.status_text.value = f"{len(self.current_documents)} 件のドキュメントが見つかりました"
-                else:
-                    self.status_text.value = f"{len(self.current_documents)} ドキュメントが読み込まれました"
+                self.documents_view.prev_page_button.disabled = offset == 0
+                self.documents_view.next_page_button.disabled = not has_next
+                self.status_text.value = self._documents_status(search_text, offset, has_next)
             else:
                 self.status_text.value = "データベースに接続されていません"
         except Exception as err:
             self.status_text.value = f"エラー: {str(err)}"
-        self.page.update()
+        if not self._suspend_update:
+            self.page.update()
+
+    def _documents_status(self, search_text: str, offset: int, has_next: bool) -> str:
+        """
+        ドキュメント一覧の読み込み結果を表すステータスの文言を返す
+        複数ページにわたる場合は件数ではなく、表示しているページの範囲を示す
+
+        Args:
+            search_text: 検索文字列
+            offset: 表示しているページの先頭位置
+            has_next: 次のページがあるかどうか
+
+        Returns:
+            str: ステータスの文言
+        """
+        count = len(self.current_documents)
+        if offset or has_next:
+            page_range = f"{offset + 1}〜{offset + count}件目"
+            if search_text:
+                return f"検索結果の{page_range}を表示しています"
+            return f"ドキュメントの{page_range}を表示しています"
+
+        if search_text:
+            return f"{count} 件のドキュメントが見つかりました"
+        return f"{count} ドキュメントが読み込まれました"
+
+    def notify(self, message: str) -> None:
+        """スナックバーでメッセージを通知する（表示は呼び出し側のpage.update()でまとめて反映される）"""
+        self._snack_text.value = message
+        self._snack_bar.open = True
+
+    def _update_documents_table(self) -> None:
+        """
+        読み込んだドキュメントをテーブルに表示する
+        行のコントロールは使い回し、足りない分だけ作成してテキストの値のみを書き換える
+        """
+        row_pool = self._row_pool
+        for i, doc in enumerate(self.current_documents):
+            if i >= len(row_pool):
+                row_pool.append(
+                    ft.DataRow(
+                        cells=[
+                            ft.DataCell(ft.Text()),  # ID
+                            ft.DataCell(ft.Text()),  # Title
+                            ft.DataCell(ft.Text(expand=True)),  # Content
+                            ft.DataCell(ft.Text()),  # Created
+                            ft.DataCell(ft.Text()),  # Updated
+                        ],
+                        on_select_changed=self._on_row_select,
+                    )
+                )
+            row = row_pool[i]
+            row.data = doc[0]
+            cells = row.cells
+            cells[0].content.value = str(doc[0])
+            cells[1].content.value = truncate_text(doc[1])
+            cells[2].content.value = truncate_text(doc[2])
+            cells[3].content.value = str(doc[3])
+            cells[4].content.value = str(doc[4])
+        # 表示件数が減っても行は手放さず、次に件数が増えたときに使い回す（最大でPAGE_SIZE行）
+        self.documents_view.documents_table.rows = row_pool[: len(self.current_documents)]
+
+    def _on_row_select(self, e: ft.ControlEvent) -> None:
+        """ドキュメント一覧の行が選択されたときに詳細ダイアログを表示する（全行で共有するハンドラ）"""
+        self.dialog_manager.show_document_detail(e.control.data)
+
+    def _fetch_documents(self, query: str, params: tuple) -> list[tuple]:
+        """ドキュメント一覧をデータベースから取得する（キャッシュ経由で呼び出す）"""
+        return self.db_handler.fetch_query(query, params)
+
+    def invalidate_documents(self) -> None:
+        """ドキュメント一覧のキャッシュを破棄する（データを変更した後に呼び出す）"""
+        self._cached_fetch_documents.cache_clear()
+        self._documents_stale = True
+
+    def reload_documents(self) -> None:
+        """キャッシュを使わずにドキュメント一覧を読み込み直す"""
+        self.invalidate_documents()
+        self.load_documents(search_text=self.documents_view.search_field.value or "")
 
     def connect_to_database(self, e: ft.ControlEvent) -> None:
         """データベースに接続する"""
@@ -657,8 +853,16 @@ class DatabaseGUI:
 
             self.is_postgres = self.connection_view.db_type_switch.value
             self.db_handler = DatabaseHandler.connect(use_postgres=self.is_postgres)
+            self.invalidate_documents()
+            self.documents_view.offset = 0
             self.status_text.value = f"{'PostgreSQL' if self.is_postgres else 'SQLite'} に接続しました"
-            self.load_documents()
+
+            # 画面遷移時にまとめて更新するため、読み込み時の更新は行わない
+            self._suspend_update = True
+            try:
+                self.load_documents()
+            finally:
+                self._suspend_update = False
 
             # 接続後はメインコンテンツを表示
             self.page.go("/documents")
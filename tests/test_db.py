@@ -0,0 +1,126 @@
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from poetry_template import db
+from poetry_template.db import SQLiteDatabaseHandler, _to_sqlite_paramstyle
+
+
+@pytest.fixture
+def handler(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[SQLiteDatabaseHandler]:
+    """一時ディレクトリにitemsテーブルを持つSQLiteデータベースを作成する"""
+    monkeypatch.setattr(db, "_APP_DIR", str(tmp_path))
+    handler = SQLiteDatabaseHandler("test.db")
+    handler.execute_query("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    yield handler
+    handler.close_connection()
+
+
+def fetch_names(handler: SQLiteDatabaseHandler) -> list[str]:
+    return [row[0] for row in handler.fetch_query("SELECT name FROM items ORDER BY id")]
+
+
+def test_transaction_commits(handler: SQLiteDatabaseHandler) -> None:
+    with handler.transaction():
+        handler.execute_query("INSERT INTO items (name) VALUES (%s)", ("a",))
+        handler.execute_query("INSERT INTO items (name) VALUES (%s)", ("b",))
+
+    assert fetch_names(handler) == ["a", "b"]
+
+
+def test_transaction_rolls_back_on_exception(handler: SQLiteDatabaseHandler) -> None:
+    with pytest.raises(ValueError), handler.transaction():
+        handler.execute_query("INSERT INTO items (name) VALUES (%s)", ("a",))
+        raise ValueError
+
+    assert fetch_names(handler) == []
+    assert not handler._get_connection().in_transaction
+
+
+def test_transaction_rolls_back_when_commit_fails(handler: SQLiteDatabaseHandler) -> None:
+    # 遅延外部キー制約の違反はCOMMIT時に初めてエラーになる
+    handler.execute_query("PRAGMA foreign_keys = ON")
+    handler.execute_query(
+        "CREATE TABLE tags (item_id INTEGER REFERENCES items (id) DEFERRABLE INITIALLY DEFERRED, name TEXT)"
+    )
+
+    with pytest.raises(sqlite3.IntegrityError), handler.transaction():
+        handler.execute_query("INSERT INTO tags (item_id, name) VALUES (%s, %s)", (999, "orphan"))
+
+    assert not handler._get_connection().in_transaction
+    assert handler.fetch_query("SELECT * FROM tags") == []
+
+    # 失敗後も同じスレッドで新しいトランザクションを開始できる
+    with handler.transaction():
+        handler.execute_query("INSERT INTO items (name) VALUES (%s)", ("a",))
+    assert fetch_names(handler) == ["a"]
+
+
+def test_nested_transaction_rolls_back_to_savepoint(handler: SQLiteDatabaseHandler) -> None:
+    with handler.transaction():
+        handler.execute_query("INSERT INTO items (name) VALUES (%s)", ("outer",))
+        with pytest.raises(ValueError), handler.transaction():
+            handler.execute_query("INSERT INTO items (name) VALUES (%s)", ("inner",))
+            raise ValueError
+        with handler.transaction():
+            handler.execute_query("INSERT INTO items (name) VALUES (%s)", ("inner2",))
+
+    assert fetch_names(handler) == ["outer", "inner2"]
+
+
+def test_execute_many_inserts_all_rows(handler: SQLiteDatabaseHandler) -> None:
+    handler.execute_many("INSERT INTO items (name) VALUES (%s)", [(f"item{i}",) for i in range(5)])
+
+    assert fetch_names(handler) == [f"item{i}" for i in range(5)]
+
+
+def test_execute_many_rolls_back_on_error(handler: SQLiteDatabaseHandler) -> None:
+    with pytest.raises(sqlite3.IntegrityError):
+        handler.execute_many("INSERT INTO items (id, name) VALUES (%s, %s)", [(1, "a"), (2, "b"), (1, "duplicate")])
+
+    assert fetch_names(handler) == []
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("SELECT * FROM items WHERE name = %s", "SELECT * FROM items WHERE name = ?"),
+        ("SELECT '%s' FROM items WHERE name = %s", "SELECT '%s' FROM items WHERE name = ?"),
+        (
+            "SELECT * FROM items WHERE name LIKE '%s%' AND id = %s",
+            "SELECT * FROM items WHERE name LIKE '%s%' AND id = ?",
+        ),
+        ("SELECT 'it''s %s', %s", "SELECT 'it''s %s', ?"),
+    ],
+)
+def test_placeholder_inside_string_literal_is_kept(query: str, expected: str) -> None:
+    assert _to_sqlite_paramstyle(query) == expected
+
+
+def test_fetch_query_with_placeholder_inside_string_literal(handler: SQLiteDatabaseHandler) -> None:
+    handler.execute_query("INSERT INTO items (name) VALUES (%s)", ("a",))
+
+    assert handler.fetch_query("SELECT '%s', name FROM items WHERE name = %s", ("a",)) == [("%s", "a")]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 10, 20])
+def test_iter_query_returns_all_rows_across_chunks(handler: SQLiteDatabaseHandler, chunk_size: int) -> None:
+    handler.execute_many("INSERT INTO items (name) VALUES (%s)", [(f"item{i}",) for i in range(10)])
+
+    rows = list(handler.iter_query("SELECT name FROM items ORDER BY id", chunk_size=chunk_size))
+
+    assert rows == [(f"item{i}",) for i in range(10)]
+
+
+def test_iter_query_can_be_closed_early(handler: SQLiteDatabaseHandler) -> None:
+    handler.execute_many("INSERT INTO items (name) VALUES (%s)", [(f"item{i}",) for i in range(10)])
+
+    rows = handler.iter_query("SELECT name FROM items ORDER BY id", chunk_size=3)
+    assert next(rows) == ("item0",)
+    rows.close()
+
+    # 読み込みを途中でやめても、同じ接続で続けてクエリを実行できる
+    handler.execute_query("INSERT INTO items (name) VALUES (%s)", ("after",))
+    assert fetch_names(handler)[-1] == "after"